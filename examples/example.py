@@ -1,3 +1,5 @@
+import sys
+
 from ngpasm.mnemonics.arithmetic import AddMnemonic
 from ngpasm.program import ASMProgram, ProgramMode
 
@@ -7,4 +9,4 @@ regs = prog.regs
 prog.insert_mnemonic(AddMnemonic(regs.AX, regs.BX))
 prog.insert_mnemonic(AddMnemonic(regs.CX, regs.BX))
 prog.insert_mnemonic(AddMnemonic(regs.DX, regs.BX))
-print(prog.generate())
+prog.write(sys.stdout)
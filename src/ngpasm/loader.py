@@ -6,10 +6,10 @@ This module have a functional for reading config files.
 
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
+from typing import Final
 
 import orjson as json
-import toml
-import yaml
 
 
 class ConfigType(Enum):
@@ -20,6 +20,16 @@ class ConfigType(Enum):
     JSON = 2
 
 
+_EXTENSION_CONFIG_TYPES: Final = MappingProxyType(
+    {
+        "json": ConfigType.JSON,
+        "yaml": ConfigType.YAML,
+        "yml": ConfigType.YAML,
+        "toml": ConfigType.TOML,
+    }
+)
+
+
 def detect_config_type_by_extension(extension: str) -> ConfigType:
     """
     Detect config type by file extension.
@@ -31,15 +41,7 @@ def detect_config_type_by_extension(extension: str) -> ConfigType:
         ConfigType: Detected config type (defaults to JSON)
 
     """
-    cleaned_extension = extension.lower().lstrip(".")
-
-    if cleaned_extension == "json":
-        return ConfigType.JSON
-    if cleaned_extension in ("yaml", "yml"):
-        return ConfigType.YAML
-    if cleaned_extension == "toml":
-        return ConfigType.TOML
-    return ConfigType.JSON
+    return _EXTENSION_CONFIG_TYPES.get(extension.lower().lstrip("."), ConfigType.JSON)
 
 
 def detect_config_type_by_filename(filename: str) -> ConfigType:
@@ -57,6 +59,40 @@ def detect_config_type_by_filename(filename: str) -> ConfigType:
     return detect_config_type_by_extension(extension)
 
 
+def _load_json(config_file: Path) -> object:
+    """Parse JSON config file."""
+    return json.loads(config_file.read_bytes())
+
+
+def _load_yaml(config_file: Path) -> object:
+    """Parse YAML config file."""
+    # Imported on demand to keep import time low
+    import yaml  # noqa: PLC0415
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with config_file.open() as f:
+        return yaml.load(f, Loader=loader)  # noqa: S506
+
+
+def _load_toml(config_file: Path) -> object:
+    """Parse TOML config file."""
+    # Imported on demand to keep import time low
+    import toml  # noqa: PLC0415
+
+    with config_file.open() as f:
+        return toml.load(f)
+
+
+_CONFIG_LOADERS: Final = MappingProxyType(
+    {
+        ConfigType.JSON: _load_json,
+        ConfigType.YAML: _load_yaml,
+        ConfigType.TOML: _load_toml,
+    }
+)
+
+
 class ConfigReader:
     """Project configuration reader."""
 
@@ -86,22 +122,15 @@ class ConfigReader:
             dict: loaded data as dictionary
 
         """
-        data = {}
-
         if not self.config_file.exists():
-            return data
-
-        if self.configtype == ConfigType.YAML:
-            with self.config_file.open() as f:
-                data = yaml.safe_load(f)
-        elif self.configtype == ConfigType.TOML:
-            with self.config_file.open() as f:
-                data = toml.load(f)
-        elif self.configtype == ConfigType.JSON:
-            with self.config_file.open("rb") as f:
-                data = json.loads(f.read())
+            return {}
+
+        data = _CONFIG_LOADERS[self.configtype](self.config_file)
 
         if not isinstance(data, dict):
-            raise TypeError(f"Invalid data: {self.config_file}")
+            raise TypeError(
+                f"Invalid data: {self.config_file} ({self.configtype.name} config "
+                f"must be a mapping, got {type(data).__name__})"
+            )
 
         return data
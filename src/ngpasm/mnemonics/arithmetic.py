@@ -1,35 +1,73 @@
-from typing import Union
+from typing import ClassVar, Final, Union
 
 from ngpasm.mnemonics.base import _ABCBasicMnemonic
 from ngpasm.registers import Register
 
+_ADD_COMMENT: Final = "Adding the %s value to the %s"
+_SUB_COMMENT: Final = "Subtract the %s value from the %s"
+_DIV_COMMENT: Final = "Dividing the %s value to the %s"
+_MUL_COMMENT: Final = "Multiplicating the %s value to the %s"
+_INC_COMMENT: Final = "Increment %s"
+_DEC_COMMENT: Final = "Decrement %s"
 
-class AddMnemonic(_ABCBasicMnemonic):
+
+class _ArithmeticMnemonic(_ABCBasicMnemonic):
     """
-    The ADD instruction in assembler performs the addition of two operands.
+    Base class for arithmetic mnemonics with a fixed operand count.
 
-    A mandatory rule is that the operands are equal in size; only two 16-bit numbers
-    or two 8-bit numbers can be added to each other.
+    Subclasses pass the instruction name, the expected number of operands and
+    a %-template for the default comment as class keywords. Operands are passed
+    to the template in reverse order (source first, then destination).
     """
 
+    __slots__ = ()
+
+    _NAME: ClassVar[str]
+    _COMMENT: ClassVar[str]
+
+    def __init_subclass__(
+        cls,
+        *,
+        name: str | None = None,
+        comment_template: str | None = None,
+        **kwargs,
+    ) -> None:
+        """Stores instruction name and comment template on the subclass."""
+        super().__init_subclass__(**kwargs)
+        if name is not None:
+            cls._NAME = name
+        if comment_template is not None:
+            cls._COMMENT = comment_template
+
     def __init__(
-        self, *operands: tuple[Union["Register", str, int]], enable_comment: bool = True
-    ):
+        self, *operands: Union["Register", str, int], enable_comment: bool = True
+    ) -> None:
         """Initialize a mnemonic."""
-        super().__init__("add", *operands, enable_comment=enable_comment)
+        super().__init__(self._NAME, *operands, enable_comment=enable_comment)
 
     def _validate(self) -> None:
-        """Validate the mnemonic."""
-        if len(self.operands) != 2:
-            raise ValueError(
-                f"Mnemonic ADD required 2 operands; but get {len(self.operands)}"
-            )
+        """Validate the mnemonic (operand count is checked via ``_ARITY``)."""
 
     def _generate_default_comment(self) -> str:
-        return f"Adding the {self.operands[1]!s} value to the {self.operands[0]!s}"
+        return self._COMMENT % self._op_strs[::-1]
+
+
+class AddMnemonic(
+    _ArithmeticMnemonic, name="add", arity=2, comment_template=_ADD_COMMENT
+):
+    """
+    The ADD instruction in assembler performs the addition of two operands.
+
+    A mandatory rule is that the operands are equal in size; only two 16-bit numbers
+    or two 8-bit numbers can be added to each other.
+    """
+
+    __slots__ = ()
 
 
-class SubMnemonic(_ABCBasicMnemonic):
+class SubMnemonic(
+    _ArithmeticMnemonic, name="sub", arity=2, comment_template=_SUB_COMMENT
+):
     """
     The ASM sub mnemonic is a subtraction instruction.
 
@@ -37,24 +75,12 @@ class SubMnemonic(_ABCBasicMnemonic):
     operand and replaces the destination with the result.
     """
 
-    def __init__(
-        self, *operands: tuple[Union["Register", str, int]], enable_comment: bool = True
-    ):
-        """Initialize a mnemonic."""
-        super().__init__("sub", *operands, enable_comment=enable_comment)
+    __slots__ = ()
 
-    def _validate(self) -> None:
-        """Validate the mnemonic."""
-        if len(self.operands) != 2:
-            raise ValueError(
-                f"Mnemonic SUB required 2 operands;but get {len(self.operands)}"
-            )
 
-    def _generate_default_comment(self) -> str:
-        return f"Subtract the {self.operands[1]!s} value from the {self.operands[0]!s}"
-
-
-class DivMnemonic(_ABCBasicMnemonic):
+class DivMnemonic(
+    _ArithmeticMnemonic, name="div", arity=2, comment_template=_DIV_COMMENT
+):
     """
     The ASM DIV mnemonic is a division instruction.
 
@@ -62,24 +88,12 @@ class DivMnemonic(_ABCBasicMnemonic):
     operand and replaces the destination with the result.
     """
 
-    def __init__(
-        self, *operands: tuple[Union["Register", str, int]], enable_comment: bool = True
-    ):
-        """Initialize a mnemonic."""
-        super().__init__("div", *operands, enable_comment=enable_comment)
-
-    def _validate(self) -> None:
-        """Validate the mnemonic."""
-        if len(self.operands) != 2:
-            raise ValueError(
-                f"Mnemonic DIV required 2 operands;but get {len(self.operands)}"
-            )
-
-    def _generate_default_comment(self) -> str:
-        return f"Dividing the {self.operands[1]!s} value to the {self.operands[0]!s}"
+    __slots__ = ()
 
 
-class MulMnemonic(_ABCBasicMnemonic):
+class MulMnemonic(
+    _ArithmeticMnemonic, name="mul", arity=2, comment_template=_MUL_COMMENT
+):
     """
     The ASM MUL mnemonic is a multiplication instruction.
 
@@ -87,60 +101,20 @@ class MulMnemonic(_ABCBasicMnemonic):
     operand and replaces the destination with the result.
     """
 
-    def __init__(
-        self, *operands: tuple[Union["Register", str, int]], enable_comment: bool = True
-    ):
-        """Initialize a mnemonic."""
-        super().__init__("mul", *operands, enable_comment=enable_comment)
+    __slots__ = ()
 
-    def _validate(self) -> None:
-        """Validate the mnemonic."""
-        if len(self.operands) != 2:
-            raise ValueError(
-                f"Mnemonic MUL required 2 operands;but get {len(self.operands)}"
-            )
-
-    def _generate_default_comment(self) -> str:
-        return (
-            f"Multiplicating the {self.operands[1]!s} value to the {self.operands[0]!s}"
-        )
 
-
-class IncMnemonic(_ABCBasicMnemonic):
+class IncMnemonic(
+    _ArithmeticMnemonic, name="inc", arity=1, comment_template=_INC_COMMENT
+):
     """The ASM INC mnemonic is a increment instruction. It increments the register."""
 
-    def __init__(
-        self, *operands: tuple[Union["Register", str, int]], enable_comment: bool = True
-    ):
-        """Initialize a mnemonic."""
-        super().__init__("inc", *operands, enable_comment=enable_comment)
-
-    def _validate(self) -> None:
-        """Validate the mnemonic."""
-        if len(self.operands) != 1:
-            raise ValueError(
-                f"Mnemonic INC required 1 operands;but get {len(self.operands)}"
-            )
-
-    def _generate_default_comment(self) -> str:
-        return f"Increment {self.operands[0]!s}"
+    __slots__ = ()
 
 
-class DecMnemonic(_ABCBasicMnemonic):
+class DecMnemonic(
+    _ArithmeticMnemonic, name="dec", arity=1, comment_template=_DEC_COMMENT
+):
     """The ASM DEC mnemonic is a decrement instruction. It decrements the register."""
 
-    def __init__(
-        self, *operands: tuple[Union["Register", str, int]], enable_comment: bool = True
-    ):
-        """Initialize a mnemonic."""
-        super().__init__("dec", *operands, enable_comment=enable_comment)
-
-    def _validate(self) -> None:
-        """Validate the mnemonic."""
-        if len(self.operands) != 1:
-            raise ValueError(
-                f"Mnemonic DEC required 1 operands;but get {len(self.operands)}"
-            )
-
-    def _generate_default_comment(self) -> str:
-        return f"Decrement {self.operands[0]!s}"
+    __slots__ = ()
@@ -1,8 +1,11 @@
+import sys
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import ClassVar, Final, Union
 
 from ngpasm.registers import Register
 
+_VALID_OPERAND_TYPES: Final[tuple[type, ...]] = (Register, str, int)
+
 
 class _ABCBasicMnemonic(ABC):
     """
@@ -19,6 +22,51 @@ class _ABCBasicMnemonic(ABC):
 
     """
 
+    __slots__ = (
+        "_body",
+        "_comment",
+        "_default_comment",
+        "_enable_comment",
+        "_mnemonic_upper",
+        "_op_strs",
+        "mnemonic_name",
+        "operands",
+    )
+
+    # Expected number of operands; ``None`` accepts any amount
+    _ARITY: ClassVar[int | None] = None
+
+    # Default comment templates indexed by operand count; operands are passed
+    # in reverse order (source first, then destination)
+    _COMMENT_FORMATS: ClassVar[tuple[str, ...]] = (
+        "%s operation.",
+        "%s operand %s.",
+        "%s from %s to %s.",
+    )
+    _MANY_OPERANDS_COMMENT: ClassVar[str] = "%s with %d operands."
+
+    mnemonic_name: Final[str]
+    operands: Final[tuple[Union["Register", str, int], ...]]
+    _mnemonic_upper: Final[str]
+    _op_strs: Final[tuple[str, ...]]
+    _body: Final[str]
+    _enable_comment: bool
+    _comment: str | None
+    _default_comment: str | None
+
+    def __init_subclass__(cls, *, arity: int | None = None, **kwargs) -> None:
+        """
+        Configures a mnemonic subclass.
+
+        Args:
+            arity: Expected number of operands (overrides ``_ARITY``).
+            **kwargs: Forwarded to ``object.__init_subclass__``.
+
+        """
+        super().__init_subclass__(**kwargs)
+        if arity is not None:
+            cls._ARITY = arity
+
     def __init__(
         self,
         mnemonic_name: str,
@@ -34,15 +82,32 @@ class _ABCBasicMnemonic(ABC):
             enable_comment: Whether to generate comments in output.
 
         """
-        self.mnemonic_name = mnemonic_name
+        self.mnemonic_name = sys.intern(mnemonic_name)
+        self._mnemonic_upper = sys.intern(mnemonic_name.upper())
         self.operands = operands
         self._enable_comment = enable_comment
-        self._comment: str | None = None
+        self._comment = None
+
+        if self._ARITY is not None and len(operands) != self._ARITY:
+            raise ValueError(
+                f"Mnemonic {self._mnemonic_upper} required {self._ARITY} operands; "
+                f"but get {len(operands)}"
+            )
 
         self._validate()
+        self._validate_operand_types()
+
+        self._op_strs = tuple(
+            op.name if type(op) is Register else str(op) for op in operands
+        )
+        self._body = (
+            f"{mnemonic_name} {self._format_operands()}" if operands else mnemonic_name
+        )
+        # Generated lazily on first use by construct()
+        self._default_comment = None
 
     @abstractmethod
-    def _validate(self):
+    def _validate(self) -> None:
         """Validate mnemonics operands and other fields."""
 
     @property
@@ -69,16 +134,14 @@ class _ABCBasicMnemonic(ABC):
             Appropriately formatted comment string.
 
         """
-        operand_count = len(self.operands)
-        instruction = self.mnemonic_name.upper()
+        operand_count = len(self._op_strs)
 
-        if operand_count == 0:
-            return f"{instruction} operation."
-        if operand_count == 1:
-            return f"{instruction} operand {self.operands[0]!s}."
-        if operand_count == 2:
-            return f"{instruction} from {self.operands[1]!s} to {self.operands[0]!s}."
-        return f"{instruction} with {operand_count} operands."
+        if operand_count < len(self._COMMENT_FORMATS):
+            return self._COMMENT_FORMATS[operand_count] % (
+                self._mnemonic_upper,
+                *self._op_strs[::-1],
+            )
+        return self._MANY_OPERANDS_COMMENT % (self._mnemonic_upper, operand_count)
 
     def _validate_operand_types(self) -> None:
         """
@@ -88,9 +151,8 @@ class _ABCBasicMnemonic(ABC):
             TypeError: If any operand has invalid type.
 
         """
-        allowed_types = (Register, str, int)
         for i, operand in enumerate(self.operands, 1):
-            if not isinstance(operand, allowed_types):
+            if not isinstance(operand, _VALID_OPERAND_TYPES):
                 raise TypeError(
                     f"Operand {i} has invalid type {type(operand).__name__}. "
                     f"Allowed types: Register, str, int."
@@ -104,7 +166,10 @@ class _ABCBasicMnemonic(ABC):
             Comma-separated operand string.
 
         """
-        return ", ".join(str(op) for op in self.operands)
+        op_strs = self._op_strs
+        if len(op_strs) == 1:
+            return op_strs[0]
+        return ", ".join(op_strs)
 
     def construct(self, indent: str = "") -> str:
         """
@@ -117,21 +182,17 @@ class _ABCBasicMnemonic(ABC):
             Formatted assembly instruction with optional comment.
 
         """
-        self._validate_operand_types()
-
-        # Build instruction core
-        instruction = self.mnemonic_name
-        if self.operands:
-            instruction += " " + self._format_operands()
-
-        # Add comment if enabled
         if self._enable_comment:
-            comment = self._comment or self._generate_default_comment()
-            return f"{indent}{instruction}  ; {comment}"
+            comment = self._comment or self._default_comment
+            if comment is None:
+                comment = self._default_comment = self._generate_default_comment()
+            return f"{indent}{self._body}  ; {comment}"
 
-        return f"{indent}{instruction}"
+        return indent + self._body
 
 
 class _BasicMnemonic(_ABCBasicMnemonic):
-    def _validate(self):
+    __slots__ = ()
+
+    def _validate(self) -> None:
         pass
@@ -1,4 +1,7 @@
+import io
+from collections.abc import Iterable, Iterator
 from enum import Enum
+from typing import TextIO
 
 from ngpasm.mnemonics.base import _BasicMnemonic
 from ngpasm.registers import get_registers
@@ -15,11 +18,24 @@ class ProgramMode(Enum):
 class ASMProgram:
     """Assembler program class."""
 
-    def __init__(self, filename: str, mode: ProgramMode):
-        """Initialize a program."""
+    def __init__(self, filename: str, mode: ProgramMode, *, stream_mode: bool = False):
+        """
+        Initialize a program.
+
+        Args:
+            filename: Name of the output file.
+            mode: Program mode.
+            stream_mode: Keep only rendered lines and drop mnemonic objects
+                after insertion. Saves memory for large write-once programs,
+                but ``mnemonics`` stays empty and later changes to inserted
+                mnemonics or to the indentation do not affect rendered lines.
+
+        """
         self.filename = filename
         self.mode = mode
+        self._stream_mode = stream_mode
         self._mnemonics = []
+        self._lines: list[str] = []
         self._current_indent_level = 0
         self._indent = ""
         self._regs = get_registers(self.mode.value)
@@ -36,10 +52,43 @@ class ASMProgram:
 
     def insert_mnemonic(self, mnemonic: _BasicMnemonic):
         """Insert mnemonic to the program."""
-        self._mnemonics.append(mnemonic)
+        if self._stream_mode:
+            self._lines.append(mnemonic.construct(self._indent))
+        else:
+            self._mnemonics.append(mnemonic)
+
+    def insert_mnemonics(self, mnemonics: Iterable[_BasicMnemonic]):
+        """Insert several mnemonics to the program at once."""
+        if self._stream_mode:
+            indent = self._indent
+            self._lines.extend(mnemonic.construct(indent) for mnemonic in mnemonics)
+        else:
+            self._mnemonics.extend(mnemonics)
+
+    def _render_lines(self) -> Iterator[str]:
+        """Yield rendered program lines."""
+        if self._stream_mode:
+            yield from self._lines
+            return
+
+        indent = self._indent
+        for mnemonic in self._mnemonics:
+            yield mnemonic.construct(indent)
 
     def generate(self):
         """Generate program."""
-        program = [mnemonic.construct(self._indent) for mnemonic in self._mnemonics]
+        buffer = io.StringIO()
+        separator = ""
+
+        for line in self._render_lines():
+            buffer.write(separator)
+            buffer.write(line)
+            separator = "\n"
+
+        return buffer.getvalue()
 
-        return "\n".join(program)
+    def write(self, fp: TextIO):
+        """Write program to a text stream, one instruction per line."""
+        for line in self._render_lines():
+            fp.write(line)
+            fp.write("\n")
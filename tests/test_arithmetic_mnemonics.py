@@ -17,113 +17,54 @@ class MockRegister(Register):
         super().__init__(name, size)
 
 
-@pytest.fixture
-def mock_registers():
-    return [
-        MockRegister("RAX"),
-        MockRegister("RBX"),
-        MockRegister("RCX"),
-        MockRegister("AL"),
-    ]
-
-
-def test_add_mnemonic_validation(mock_registers):
-    # Valid
-    AddMnemonic(mock_registers[0], mock_registers[1])
-
-    # Invalid operand count
-    with pytest.raises(ValueError):
-        AddMnemonic(mock_registers[0])
-    with pytest.raises(ValueError):
-        AddMnemonic(mock_registers[0], mock_registers[1], mock_registers[2])
-
-
-def test_add_mnemonic_comment(mock_registers):
-    mnemonic = AddMnemonic(mock_registers[0], mock_registers[1])
-    assert "Adding the RBX value to the RAX" in mnemonic._generate_default_comment()
-
-
-def test_sub_mnemonic_validation(mock_registers):
-    # Valid
-    SubMnemonic(mock_registers[0], mock_registers[1])
-
-    # Invalid operand count
-    with pytest.raises(ValueError):
-        SubMnemonic(mock_registers[0])
-    with pytest.raises(ValueError):
-        SubMnemonic(mock_registers[0], mock_registers[1], mock_registers[2])
-
-
-def test_sub_mnemonic_comment(mock_registers):
-    mnemonic = SubMnemonic(mock_registers[0], mock_registers[1])
-    assert "Subtract the RBX value from the RAX" in mnemonic._generate_default_comment()
-
-
-def test_div_mnemonic_validation(mock_registers):
-    # Valid
-    DivMnemonic(mock_registers[0], mock_registers[1])
-
-    # Invalid operand count
-    with pytest.raises(ValueError):
-        DivMnemonic(mock_registers[0])
+RAX = MockRegister("RAX")
+RBX = MockRegister("RBX")
+RCX = MockRegister("RCX")
+AL = MockRegister("AL")
+OPERANDS = (RAX, RBX, RCX, AL)
+
+
+# (mnemonic class, instruction name, operand count, default comment)
+MNEMONIC_SPECS = [
+    (AddMnemonic, "add", 2, "Adding the RBX value to the RAX"),
+    (SubMnemonic, "sub", 2, "Subtract the RBX value from the RAX"),
+    (DivMnemonic, "div", 2, "Dividing the RBX value to the RAX"),
+    (MulMnemonic, "mul", 2, "Multiplicating the RBX value to the RAX"),
+    (IncMnemonic, "inc", 1, "Increment RAX"),
+    (DecMnemonic, "dec", 1, "Decrement RAX"),
+]
+
+INVALID_OPERAND_COUNTS = [
+    (cls, count)
+    for cls, _, arity, _ in MNEMONIC_SPECS
+    for count in range(arity + 2)
+    if count != arity
+]
+
+DEFAULT_COMMENTS = [
+    (cls, arity, default_comment) for cls, _, arity, default_comment in MNEMONIC_SPECS
+]
+
+
+@pytest.mark.parametrize(("cls", "operand_count"), INVALID_OPERAND_COUNTS)
+def test_arithmetic_mnemonic_invalid_operands(cls, operand_count):
     with pytest.raises(ValueError):
-        DivMnemonic(mock_registers[0], mock_registers[1], mock_registers[2])
+        cls(*OPERANDS[:operand_count])
 
 
-def test_div_mnemonic_comment(mock_registers):
-    mnemonic = DivMnemonic(mock_registers[0], mock_registers[1])
-    assert "Dividing the RBX value to the RAX" in mnemonic._generate_default_comment()
+@pytest.mark.parametrize(("cls", "arity", "default_comment"), DEFAULT_COMMENTS)
+def test_arithmetic_mnemonic_comment(cls, arity, default_comment):
+    mnemonic = cls(*OPERANDS[:arity])
+    assert mnemonic._generate_default_comment() == default_comment
 
 
-def test_mul_mnemonic_validation(mock_registers):
-    # Valid
-    MulMnemonic(mock_registers[0], mock_registers[1])
-
-    # Invalid operand count
-    with pytest.raises(ValueError):
-        MulMnemonic(mock_registers[0])
-    with pytest.raises(ValueError):
-        MulMnemonic(mock_registers[0], mock_registers[1], mock_registers[2])
-
-
-def test_mul_mnemonic_comment(mock_registers):
-    mnemonic = MulMnemonic(mock_registers[0], mock_registers[1])
-    assert (
-        "Multiplicating the RBX value to the RAX"
-        in mnemonic._generate_default_comment()
-    )
-
-
-def test_inc_mnemonic_validation(mock_registers):
-    # Valid
-    IncMnemonic(mock_registers[0])
-
-    # Invalid operand count
-    with pytest.raises(ValueError):
-        IncMnemonic()
-    with pytest.raises(ValueError):
-        IncMnemonic(mock_registers[0], mock_registers[1])
-
-
-def test_inc_mnemonic_comment(mock_registers):
-    mnemonic = IncMnemonic(mock_registers[0])
-    assert "Increment RAX" in mnemonic._generate_default_comment()
-
-
-def test_dec_mnemonic_validation(mock_registers):
-    # Valid
-    DecMnemonic(mock_registers[0])
-
-    # Invalid operand count
-    with pytest.raises(ValueError):
-        DecMnemonic()
-    with pytest.raises(ValueError):
-        DecMnemonic(mock_registers[0], mock_registers[1])
-
+@pytest.mark.parametrize(("cls", "name", "arity", "default_comment"), MNEMONIC_SPECS)
+def test_arithmetic_mnemonic_construct(cls, name, arity, default_comment):
+    operands = OPERANDS[:arity]
+    expected = f"{name} {', '.join(op.name for op in operands)}"
 
-def test_dec_mnemonic_comment(mock_registers):
-    mnemonic = DecMnemonic(mock_registers[0])
-    assert "Decrement RAX" in mnemonic._generate_default_comment()
+    assert cls(*operands).construct() == f"{expected}  ; {default_comment}"
+    assert cls(*operands, enable_comment=False).construct("    ") == f"    {expected}"
 
 
 def test_arithmetic_mnemonics_with_non_register_operands():
@@ -137,9 +78,9 @@ def test_arithmetic_mnemonics_with_non_register_operands():
 
 
 def test_arithmetic_mnemonics_invalid_operand_types():
-    # Must call construct() to trigger type validation
+    # Type validation happens on initialization
     with pytest.raises(TypeError):
-        AddMnemonic(3.14, Register("RAX", 64)).construct()
+        AddMnemonic(3.14, Register("RAX", 64))
 
     with pytest.raises(TypeError):
-        SubMnemonic(Register("RAX", 64), [1, 2, 3]).construct()
+        SubMnemonic(Register("RAX", 64), [1, 2, 3])
@@ -133,7 +133,7 @@ def test_config_reader_invalid_content(
 @pytest.mark.parametrize(("config_type", "content", "extension"), NON_DICT_ERROR_CASES)
 def test_config_reader_non_dict_error(tmp_config_file, config_type, content, extension):
     config_file = tmp_config_file(content, extension)
-    with pytest.raises(TypeError):
+    with pytest.raises(TypeError, match="must be a mapping, got list"):
         ConfigReader(str(config_file), configtype=config_type)
 
 
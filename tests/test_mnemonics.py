@@ -90,3 +90,20 @@ def test_construct_with_indent():
     mnemonic = ConcreteMnemonic("dec", "index", enable_comment=False)
     result = mnemonic.construct("    ")
     assert result == "    dec index"
+
+
+def test_construct_with_comment_enabled_later():
+    mnemonic = ConcreteMnemonic("push", "RAX", enable_comment=False)
+    assert mnemonic.construct() == "push RAX"
+
+    mnemonic._enable_comment = True
+    assert mnemonic.construct() == "push RAX  ; PUSH operand RAX."
+
+
+def test_arity_validation():
+    class UnaryMnemonic(_BasicMnemonic):
+        _ARITY = 1
+
+    UnaryMnemonic("push", "RAX")
+    with pytest.raises(ValueError, match="PUSH required 1 operands"):
+        UnaryMnemonic("push", "RAX", "RBX")
@@ -1,4 +1,6 @@
 # test_program.py
+import io
+
 import pytest
 
 from ngpasm.mnemonics.base import _BasicMnemonic
@@ -87,3 +89,58 @@ def test_program_with_comments():
     result = program.generate()
     assert "add RAX, 10" in result
     assert "; ADD from 10 to RAX." in result
+
+
+def test_insert_mnemonics(sample_program):
+    mnemonics = [MockMnemonic("push", "RAX"), MockMnemonic("pop", "RBX")]
+    sample_program.insert_mnemonics(iter(mnemonics))
+    assert sample_program.mnemonics == mnemonics
+    assert sample_program.generate() == "push RAX\npop RBX"
+
+
+def test_generate_after_indent_change(sample_program):
+    sample_program.insert_mnemonic(MockMnemonic("push", "RAX"))
+    assert sample_program.generate() == "push RAX"
+
+    sample_program._indent = "    "
+    sample_program.insert_mnemonic(MockMnemonic("pop", "RBX"))
+    assert sample_program.generate() == "    push RAX\n    pop RBX"
+
+
+def test_generate_after_comment_change(sample_program):
+    mnemonic = MockMnemonic("push", "RAX", enable_comment=True)
+    sample_program.insert_mnemonic(mnemonic)
+    assert sample_program.generate() == "push RAX  ; PUSH operand RAX."
+
+    mnemonic.comment = "save RAX"
+    assert sample_program.generate() == "push RAX  ; save RAX"
+
+
+def test_generate_after_mnemonic_replacement(sample_program):
+    sample_program.insert_mnemonic(MockMnemonic("push", "RAX"))
+    assert sample_program.generate() == "push RAX"
+
+    sample_program.mnemonics[0] = MockMnemonic("pop", "RBX")
+    assert sample_program.generate() == "pop RBX"
+
+    sample_program.mnemonics.pop()
+    sample_program.insert_mnemonic(MockMnemonic("ret"))
+    assert sample_program.generate() == "ret"
+
+
+def test_stream_mode():
+    program = ASMProgram("test.asm", ProgramMode.x64bit, stream_mode=True)
+    program.insert_mnemonic(MockMnemonic("push", "RAX"))
+    program.insert_mnemonics([MockMnemonic("pop", "RBX"), MockMnemonic("ret")])
+
+    assert program.mnemonics == []
+    assert program.generate() == "push RAX\npop RBX\nret"
+
+
+def test_write(sample_program):
+    sample_program.insert_mnemonic(MockMnemonic("push", "RAX"))
+    sample_program.insert_mnemonic(MockMnemonic("pop", "RBX"))
+
+    buffer = io.StringIO()
+    sample_program.write(buffer)
+    assert buffer.getvalue() == "push RAX\npop RBX\n"
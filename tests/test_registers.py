@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 
 from ngpasm.registers import (
@@ -19,10 +21,11 @@ def test_register_creation() -> None:
     assert reg.parent is None  # noqa: S101
 
 
-def test_register_validation() -> None:
+@pytest.mark.parametrize("size", [-8, 0, 7, 9, 24, 63, 65, 128, "16", None, 16.0])
+def test_register_validation(size: object) -> None:
     """Test Register size validation."""
     with pytest.raises(ValueError):  # noqa: PT011
-        Register("INVALID", 128)
+        Register("INVALID", size)
 
 
 def test_register_hierarchy() -> None:
@@ -34,6 +37,17 @@ def test_register_hierarchy() -> None:
     assert parent in child.get_full_hierarchy()  # noqa: S101
 
 
+def test_register_asdict() -> None:
+    """Test registers convert to dicts and tuples without recursion."""
+    child = Register("AL", 8, parent=Register("AX", 16))
+
+    as_dict = dataclasses.asdict(child)
+    assert as_dict["name"] == "AL"  # noqa: S101
+    assert as_dict["parent"]["name"] == "AX"  # noqa: S101
+    assert as_dict["parent"]["parent"] is None  # noqa: S101
+    assert dataclasses.astuple(child)[:2] == ("AL", 8)  # noqa: S101
+
+
 def test_base_register_set_abstract() -> None:
     """Test BaseRegisterSet is abstract."""
     with pytest.raises(NotImplementedError):  # noqa: PT012
@@ -149,6 +163,7 @@ def test_register_hierarchy_in_set() -> None:
     # Test hierarchy from bottom-up
     hierarchy = al.get_full_hierarchy()
     assert rax in hierarchy  # noqa: S101
+    assert hierarchy == (al, regs["AX"], regs["EAX"], rax)  # noqa: S101
 
 
 @pytest.mark.parametrize(
@@ -216,3 +231,39 @@ def test_register_set_contains() -> None:
     assert regs.contains("EAX")  # noqa: S101
     assert regs.contains("eax")  # noqa: S101
     assert not regs.contains("INVALID")  # noqa: S101
+
+
+def test_register_attribute_access() -> None:
+    """Test attribute-style register access."""
+    regs = RegisterSet64(64)
+    assert regs.RAX is regs["RAX"]  # noqa: S101
+    assert regs.RAX_ALIAS is regs["RAX"]  # noqa: S101
+    assert not hasattr(regs, "INVALID")  # noqa: S101
+
+
+def test_get_registers_returns_shared_instance() -> None:
+    """Test get_registers reuses register set instances."""
+    assert get_registers("64") is get_registers("64")  # noqa: S101
+    assert get_registers("16") is not get_registers("32")  # noqa: S101
+
+
+def test_register_set_bitness_read_only() -> None:
+    """Test shared register sets cannot have their bitness reassigned."""
+    regs = get_registers("64")
+    with pytest.raises(AttributeError):
+        regs.bitness = 16
+    assert regs.bitness == 64  # noqa: S101
+
+
+def test_register_lookup_case_insensitive() -> None:
+    """Test case-insensitive lookup for non upper-case register names."""
+    reg = Register("xmm0", 64)
+
+    class TestSet(BaseRegisterSet):
+        def _build_register_set(self) -> None:
+            self._registers = {"xmm0": reg}
+
+    regs = TestSet(64)
+    assert regs.get("XMM0") is reg  # noqa: S101
+    assert regs.get("Xmm0") is reg  # noqa: S101
+    assert regs.contains("XMM0")  # noqa: S101